@@ -8,10 +8,14 @@ Description: A command-line tool to analyze CSV files, compute statistics, and d
 import argparse
 import sys
 import os
+import io
+import re
+import csv
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
 import math
 from datetime import datetime
 import json
@@ -19,6 +23,90 @@ import warnings
 
 warnings.filterwarnings('ignore')
 
+try:
+    from _hist_numba import hist_uniform
+except ImportError:
+    hist_uniform = None
+
+try:
+    from _render import render_inline
+except ImportError:
+    render_inline = None
+
+# Columns smaller than this are binned with NumPy; JIT dispatch overhead
+# only pays off on large arrays.
+NUMBA_MIN_SIZE = 100_000
+
+# Per-column reservoir size used by streaming mode for quantiles/histograms.
+RESERVOIR_SIZE = 100_000
+
+
+class _StreamingColumnStats:
+    """Online accumulator for one column's statistics.
+
+    Count, missing, min, max, mean, and variance are folded in exactly —
+    mean/variance with Welford's algorithm, combined one batch at a time —
+    while a bounded reservoir sample stands in for the full column when
+    quantiles and histograms are needed. A t-digest would bound quantile
+    error more tightly, but the seeded reservoir needs no extra dependency
+    and feeds the existing histogram renderers directly.
+    """
+
+    def __init__(self, rng: np.random.Generator,
+                 reservoir_size: int = RESERVOIR_SIZE):
+        self.rng = rng
+        self.reservoir_size = reservoir_size
+        self.count = 0
+        self.missing = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._reservoir = np.empty(reservoir_size, dtype=np.float64)
+
+    def update(self, arr: np.ndarray) -> None:
+        """Fold one batch of raw column values into the running stats."""
+        if arr.dtype.kind == 'f':
+            a = arr[~np.isnan(arr)]
+        else:
+            a = arr.astype(np.float64)
+        self.missing += arr.size - a.size
+        if a.size == 0:
+            return
+
+        self.min = min(self.min, float(a.min()))
+        self.max = max(self.max, float(a.max()))
+
+        # Chan et al. pairwise combine of this batch's Welford moments.
+        batch_mean = float(a.mean(dtype=np.float64))
+        batch_m2 = float(((a - batch_mean) ** 2).sum(dtype=np.float64))
+        total = self.count + a.size
+        delta = batch_mean - self.mean
+        self.mean += delta * a.size / total
+        self._m2 += batch_m2 + delta * delta * self.count * a.size / total
+
+        # Vectorized algorithm-R reservoir update.
+        fill = max(0, min(self.reservoir_size - self.count, a.size))
+        if fill:
+            self._reservoir[self.count:self.count + fill] = a[:fill]
+        rest = a[fill:]
+        if rest.size:
+            positions = self.count + fill + np.arange(rest.size)
+            slots = self.rng.integers(0, positions + 1)
+            chosen = slots < self.reservoir_size
+            self._reservoir[slots[chosen]] = rest[chosen]
+
+        self.count = total
+
+    @property
+    def std(self) -> float:
+        return (math.sqrt(self._m2 / (self.count - 1))
+                if self.count > 1 else float('nan'))
+
+    def sample(self) -> np.ndarray:
+        """Return the reservoir (the whole column while it fits)."""
+        return self._reservoir[:min(self.count, self.reservoir_size)]
+
 
 class CSVVisualizer:
     """Main class for CSV visualization and statistics."""
@@ -26,7 +114,8 @@ class CSVVisualizer:
     def __init__(self, csv_path: str, columns: Optional[List[str]] = None,
                  bins: int = 10, sample_size: Optional[int] = None,
                  histogram_width: int = 20, show_all_stats: bool = False,
-                 random_state: int = 42):
+                 random_state: int = 42, precision: str = 'f32',
+                 streaming: bool = False):
         self.csv_path = csv_path
         self.columns = columns
         self.bins = bins
@@ -34,9 +123,14 @@ class CSVVisualizer:
         self.histogram_width = histogram_width
         self.show_all_stats = show_all_stats
         self.random_state = random_state
+        self.precision = precision
+        self.streaming = streaming
         self.data = None
         self.numeric_columns = []
+        self.row_count = 0
         self.quiet_mode = False
+        self._clean_cache: Dict[str, np.ndarray] = {}
+        self._hist_cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
 
         # Statistics templates
         self.stat_templates = {
@@ -56,10 +150,136 @@ class CSVVisualizer:
             'cv': '{:.2%}',
         }
 
+    def _load_dataframe(self) -> pd.DataFrame:
+        """Read the CSV into a DataFrame, preferring PyArrow's parallel parser.
+
+        PyArrow's multithreaded reader moves bytes much faster than pandas'
+        parser, and selecting columns on the Arrow table lets us drop unused
+        string columns before they are ever materialized as Python objects.
+        Falls back to pd.read_csv when PyArrow is not installed.
+        """
+        if self.sample_size:
+            sampled = self._read_csv_sampled()
+            if sampled is not None:
+                return sampled
+
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pac
+        except ImportError:
+            return self._read_csv_pandas()
+
+        read_options = pac.ReadOptions(use_threads=True, block_size=8 << 20)
+        try:
+            table = pac.read_csv(self.csv_path, read_options=read_options)
+        except pa.ArrowInvalid as e:
+            if 'Empty CSV file' in str(e):
+                raise ValueError("CSV file is empty")
+            raise
+
+        numeric_names = [f.name for f in table.schema
+                         if pa.types.is_integer(f.type) or pa.types.is_floating(f.type)]
+
+        if self.columns:
+            # Keep only the requested columns so missing-column warnings and
+            # filtering downstream behave exactly as before.
+            keep = [c for c in table.column_names if c in self.columns]
+            if not keep:
+                keep = numeric_names
+        else:
+            keep = numeric_names
+
+        if not keep:
+            # No numeric columns at all; convert everything and let the
+            # usual "No numeric columns found" check report it.
+            keep = table.column_names
+
+        return table.select(keep).to_pandas(self_destruct=True)
+
+    @staticmethod
+    def _count_lines(path: str) -> int:
+        """Count lines with a raw byte-block scan, never decoding any text."""
+        count = 0
+        last = b'\n'
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(1 << 22)
+                if not block:
+                    break
+                count += block.count(b'\n')
+                last = block[-1:]
+        if last != b'\n':
+            count += 1
+        return count
+
+    def _read_csv_sampled(self) -> Optional[pd.DataFrame]:
+        """Sample rows at parse time instead of after a full read.
+
+        Parsing cost is linear in file size, so reading everything just to
+        throw most of it away is wasteful. Count the data rows with a cheap
+        byte scan, draw the sample indices up front, and hand pd.read_csv
+        the complement as skiprows= so discarded rows never leave the
+        parser. Returns None when the file is too small to sample (or the
+        row count looks unreliable, e.g. quoted embedded newlines), letting
+        the normal load path handle it.
+        """
+        n_rows = self._count_lines(self.csv_path) - 1
+        if n_rows <= self.sample_size:
+            return None
+
+        rng = np.random.default_rng(self.random_state)
+        keep = rng.choice(n_rows, self.sample_size, replace=False)
+        # Data rows are 1-based relative to the header line.
+        skip = np.setdiff1d(np.arange(1, n_rows + 1), keep + 1)
+        data = pd.read_csv(self.csv_path, skiprows=skip.tolist())
+        if len(data) != self.sample_size:
+            # Line count disagreed with the parser (embedded newlines);
+            # replay the safe full-read path.
+            return None
+        if not getattr(self, "quiet_mode", False):
+            print(f"[INFO] Sampled {self.sample_size} rows from dataset")
+        return data
+
+    def _read_csv_pandas(self) -> pd.DataFrame:
+        """pd.read_csv fallback, specialized from a cheap 1024-row probe.
+
+        The probe infers which columns are numeric, so the full parse can be
+        given usecols= (string columns never enter the C parser) and an
+        explicit dtype= mapping (no per-row type inference).
+        """
+        probe = pd.read_csv(self.csv_path, nrows=1024)
+        numeric = probe.select_dtypes(include=['number']).columns
+
+        if self.columns:
+            usecols = [c for c in probe.columns if c in self.columns]
+            if not usecols:
+                usecols = list(numeric)
+        else:
+            usecols = list(numeric)
+
+        if not usecols:
+            # Nothing numeric in the probe; fall through to a plain read so
+            # the usual "No numeric columns found" check reports it.
+            return probe if len(probe) < 1024 else pd.read_csv(self.csv_path)
+
+        dtypes = None
+        if self.precision == 'f32':
+            dtypes = {c: 'float32' for c in numeric if c in usecols}
+
+        try:
+            return pd.read_csv(self.csv_path, usecols=usecols, dtype=dtypes,
+                               engine='c')
+        except (ValueError, TypeError):
+            # The probe guessed wrong (e.g. a column stops being numeric
+            # after row 1024); replay the safe unspecialized read.
+            return pd.read_csv(self.csv_path)
+
     def load_and_prepare_data(self) -> None:
         """Load CSV file and prepare data for analysis."""
+        self._clean_cache.clear()
+        self._hist_cache.clear()
         try:
-            self.data = pd.read_csv(self.csv_path)
+            self.data = self._load_dataframe()
 
             if self.data.empty:
                 raise ValueError("CSV file contains no data")
@@ -70,11 +290,11 @@ class CSVVisualizer:
                 if not getattr(self, "quiet_mode", False):
                     print(f"[INFO] Sampled {self.sample_size} rows from dataset")
 
-            # Identify numeric columns
-            numeric_cols = self.data.select_dtypes(include=["number"]).columns.tolist()
-
-            # Remove numeric columns that have all NaN values
-            numeric_cols = [c for c in numeric_cols if self.data[c].notna().any()]
+            # Identify numeric columns, dropping any that are all-NaN, in
+            # one C-level notna scan instead of a pass per column
+            numeric_cols = self.data.select_dtypes(include=["number"]).columns
+            has_values = self.data[numeric_cols].notna().any(axis=0)
+            numeric_cols = numeric_cols[has_values].tolist()
 
             # Filter to requested columns if specified
             if self.columns:
@@ -85,7 +305,17 @@ class CSVVisualizer:
                             print(f"[WARNING] Column '{c}' not found in CSV file")
                 numeric_cols = [c for c in numeric_cols if c in valid_columns]
 
+            # Halve memory traffic on the stats pipeline: float32 is ample
+            # for the 4-decimal display precision, and to_numeric only
+            # downcasts when the values survive the conversion exactly.
+            if self.precision == 'f32':
+                for c in numeric_cols:
+                    self.data[c] = pd.to_numeric(self.data[c], downcast='float')
+
             self.numeric_columns = numeric_cols
+            # Record the row count here so downstream consumers (reports,
+            # the CLI summary) never need to re-measure the DataFrame.
+            self.row_count = len(self.data)
 
             if not self.numeric_columns:
                 raise ValueError("No numeric columns found")
@@ -99,49 +329,165 @@ class CSVVisualizer:
         except Exception as e:
             raise RuntimeError(f"Error loading CSV file: {str(e)}")
 
+    def _clean(self, column: str) -> np.ndarray:
+        """Return the column as a float ndarray with NaNs removed.
+
+        The result is cached so statistics, histograms, and the inline table
+        renderer all share one masked copy per column instead of each
+        re-scanning and re-allocating the data.
+        """
+        cached = self._clean_cache.get(column)
+        if cached is None:
+            arr = self.data[column].to_numpy()
+            if arr.dtype.kind in 'iu':
+                # Integer columns cannot hold NaN; skip the mask and the
+                # copy it would make.
+                cached = arr.astype(np.float64)
+            else:
+                if arr.dtype.kind != 'f':
+                    arr = arr.astype(np.float64)
+                cached = arr[~np.isnan(arr)]
+            self._clean_cache[column] = cached
+        return cached
+
     def calculate_statistics(self, column: str) -> Dict[str, Any]:
         """Calculate comprehensive statistics for a single column."""
-        col_data = self.data[column].dropna()
+        col_data = self._clean(column)
 
         if len(col_data) == 0:
             return {}
 
+        # Compute every reduction directly on the ndarray: one pass each for
+        # min/max/mean/std and a single np.quantile call for all three
+        # quantiles, instead of nine separate pandas traversals.
+        mn = float(col_data.min())
+        mx = float(col_data.max())
+        # Accumulate in float64 even when the column is stored as float32.
+        mean = float(col_data.mean(dtype=np.float64))
+        std = (float(col_data.std(ddof=1, dtype=np.float64))
+               if col_data.size > 1 else float('nan'))
+        q25, median, q75 = np.quantile(col_data, [0.25, 0.5, 0.75])
+
         stats = {
             'column': column,
             'count': len(col_data),
-            'missing': self.data[column].isna().sum(),
-            'min': float(col_data.min()),
-            'max': float(col_data.max()),
-            'mean': float(col_data.mean()),
-            'median': float(col_data.median()),
-            'q25': float(col_data.quantile(0.25)),
-            'q75': float(col_data.quantile(0.75)),
-            'std': float(col_data.std()),
-            'range': float(col_data.max() - col_data.min()),
-            'iqr': float(col_data.quantile(0.75) - col_data.quantile(0.25)),
-            'cv': float(col_data.std() / col_data.mean() if col_data.mean() != 0 else 0),
+            'missing': len(self.data) - col_data.size,
+            'min': mn,
+            'max': mx,
+            'mean': mean,
+            'median': float(median),
+            'q25': float(q25),
+            'q75': float(q75),
+            'std': std,
+            'range': mx - mn,
+            'iqr': float(q75 - q25),
+            'cv': std / mean if mean != 0 else 0.0,
         }
 
         if self.show_all_stats:
-            try:
-                from scipy import stats as scipy_stats
-                stats['skew'] = float(scipy_stats.skew(col_data))
-                stats['kurtosis'] = float(scipy_stats.kurtosis(col_data))
-            except ImportError:
-                stats['skew'] = float(col_data.skew())
-                stats['kurtosis'] = float(col_data.kurtosis())
+            stats['skew'], stats['kurtosis'] = self._skew_kurtosis(col_data)
 
         return stats
 
+    def _skew_kurtosis(self, col_data: np.ndarray) -> Tuple[float, float]:
+        """Compute skewness and kurtosis, preferring scipy when available."""
+        try:
+            from scipy import stats as scipy_stats
+            return (float(scipy_stats.skew(col_data)),
+                    float(scipy_stats.kurtosis(col_data)))
+        except ImportError:
+            series = pd.Series(col_data)
+            return float(series.skew()), float(series.kurtosis())
+
+    def _batch_statistics(self) -> List[Dict[str, Any]]:
+        """Compute statistics for every numeric column in one batched pass.
+
+        A single describe() call reduces all columns through pandas' C layer
+        at once, instead of per-column method chains through the Python
+        layer. calculate_statistics stays as the entry point for single
+        columns.
+        """
+        frame = self.data[self.numeric_columns]
+        # Accumulate in float64 even when columns are stored as float32,
+        # matching calculate_statistics; describe() would otherwise reduce
+        # float32 columns in float32 and drift in the displayed decimals.
+        desc = frame.astype(np.float64).describe(percentiles=[0.25, 0.5, 0.75]).T
+        missing = frame.isna().sum(axis=0)
+
+        all_stats = []
+        for column in self.numeric_columns:
+            row = desc.loc[column]
+            count = int(row['count'])
+            if count == 0:
+                continue
+            mn = float(row['min'])
+            mx = float(row['max'])
+            mean = float(row['mean'])
+            std = float(row['std'])
+            q25 = float(row['25%'])
+            q75 = float(row['75%'])
+            stats = {
+                'column': column,
+                'count': count,
+                'missing': int(missing[column]),
+                'min': mn,
+                'max': mx,
+                'mean': mean,
+                'median': float(row['50%']),
+                'q25': q25,
+                'q75': q75,
+                'std': std,
+                'range': mx - mn,
+                'iqr': q75 - q25,
+                'cv': std / mean if mean != 0 else 0.0,
+            }
+            if self.show_all_stats:
+                stats['skew'], stats['kurtosis'] = self._skew_kurtosis(
+                    self._clean(column))
+            all_stats.append(stats)
+
+        return all_stats
+
+    def _hist(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (counts, bin_edges) for a column's uniform-bin histogram.
+
+        With uniform bins the bin index is plain arithmetic, so we can skip
+        np.histogram's per-element searchsorted: scale values into
+        [0, bins) and tally with np.bincount. The result is memoized so the
+        detailed and inline renderers share one computation per column.
+        """
+        cached = self._hist_cache.get(column)
+        if cached is None:
+            a = self._clean(column)
+            mn = a.min()
+            mx = a.max()
+            if mx > mn and self.bins >= 1:
+                if hist_uniform is not None and a.size >= NUMBA_MIN_SIZE:
+                    hist = hist_uniform(a, mn, self.bins / (mx - mn), self.bins)
+                else:
+                    idx = ((a - mn) * (self.bins / (mx - mn))).astype(np.intp)
+                    # The top edge is inclusive; clamp values that land on it.
+                    idx[idx >= self.bins] = self.bins - 1
+                    hist = np.bincount(idx, minlength=self.bins)
+                edges = np.linspace(mn, mx, self.bins + 1)
+            else:
+                # Degenerate cases (min == max, or a nonsensical bin count)
+                # go through np.histogram, whose errors the renderers'
+                # try/except blocks already turn into placeholders.
+                hist, edges = np.histogram(a, bins=self.bins)
+            cached = (hist, edges)
+            self._hist_cache[column] = cached
+        return cached
+
     def create_ascii_histogram(self, column: str) -> str:
         """Create ASCII histogram for a column."""
-        col_data = self.data[column].dropna()
+        col_data = self._clean(column)
 
         if len(col_data) < 2:
             return "[Insufficient data]"
 
         try:
-            hist, bin_edges = np.histogram(col_data, bins=self.bins)
+            hist, bin_edges = self._hist(column)
         except Exception:
             return "[Error creating histogram]"
 
@@ -153,34 +499,32 @@ class CSVVisualizer:
             return "[Empty histogram]"
 
         scaled_hist = (hist / max_count * self.histogram_width).astype(int)
-        histogram_lines = []
-
-        for i in range(self.bins):
-            bar_length = scaled_hist[i]
-            if bar_length > 0:
-                bar = '█' * bar_length
-            elif hist[i] > 0:
-                bar = '▁'
-            else:
-                bar = ' '
 
-            try:
-                bin_label = f"{bin_edges[i]:.2f}-{bin_edges[i+1]:.2f}"
-            except:
-                bin_label = f"Bin {i+1}"
-            histogram_lines.append(f"{bin_label:15} |{bar}")
+        # Format every bin label in one vectorized pass over the edges
+        # instead of one f-string per bin.
+        bin_labels = np.char.add(
+            np.char.mod('%.2f', bin_edges[:-1]),
+            np.char.add('-', np.char.mod('%.2f', bin_edges[1:])))
+
+        # Pick every bar without per-bin branching: build all full bars at
+        # once, then let nested np.where select bar / stub / blank.
+        full_bars = np.char.multiply(np.array('█'), scaled_hist)
+        bars = np.where(scaled_hist > 0, full_bars,
+                        np.where(hist > 0, '▁', ' '))
 
-        return "\n".join(histogram_lines)
+        lines = np.char.add(
+            np.char.add(np.char.ljust(bin_labels, 15), ' |'), bars)
+        return "\n".join(lines)
 
     def create_inline_histogram(self, column: str) -> str:
         """Create a single-line inline ASCII histogram."""
-        col_data = self.data[column].dropna()
+        col_data = self._clean(column)
 
         if len(col_data) < 2:
             return "[Insufficient data]"
 
         try:
-            hist, _ = np.histogram(col_data, bins=self.bins)
+            hist, _ = self._hist(column)
         except Exception:
             return "[Error]"
 
@@ -192,9 +536,43 @@ class CSVVisualizer:
             return "[ ]"
 
         normalized = (hist / max_count * 8).astype(int)
-        ascii_chars = " ▁▂▃▄▅▆▇█"
-        histogram_chars = [ascii_chars[min(level, len(ascii_chars)-1)] for level in normalized]
-        return ''.join(histogram_chars)
+        ascii_chars = np.array(list(" ▁▂▃▄▅▆▇█"))
+        # One fancy-index lookup picks every bar character at once.
+        return ''.join(ascii_chars[np.clip(normalized, 0, ascii_chars.size - 1)])
+
+    def _render_inline_batch(self, columns: List[str]) -> Dict[str, str]:
+        """Render inline histograms for many columns in one batched pass.
+
+        Columns with enough data are stacked into a (columns x bins) count
+        matrix and rendered by _render.render_inline in a couple of array
+        operations; anything that needs a placeholder falls back to the
+        per-column renderer.
+        """
+        rendered = {}
+        batchable = []
+        for column in columns:
+            if render_inline is not None and len(self._clean(column)) >= 2:
+                batchable.append(column)
+            else:
+                rendered[column] = self.create_inline_histogram(column)
+
+        batch_counts = []
+        batch_columns = []
+        for column in batchable:
+            try:
+                batch_counts.append(self._hist(column)[0])
+                batch_columns.append(column)
+            except Exception:
+                # Unbinnable column; the per-column renderer's try/except
+                # turns it into the usual error placeholder.
+                rendered[column] = self.create_inline_histogram(column)
+
+        if batch_columns:
+            counts = np.stack(batch_counts)
+            bars = render_inline(counts, counts.max(axis=1))
+            rendered.update(zip(batch_columns, bars))
+
+        return rendered
 
     def format_statistics_table(self, all_stats: List[Dict[str, Any]]) -> str:
         """Format statistics into a readable ASCII table."""
@@ -205,82 +583,208 @@ class CSVVisualizer:
             stat_keys = ['min', 'q25', 'mean', 'median', 'q75', 'max', 'std']
             headers = ['Column', 'Min', '25%', 'Mean', 'Median', '75%', 'Max', 'Std', 'Histogram']
 
-        col_widths = [len(h) for h in headers]
-        rows = []
+        table_columns = [stats['column'] for stats in all_stats]
+        inline_histograms = self._render_inline_batch(table_columns)
 
+        rows = []
         for stats in all_stats:
             row = [stats['column'][:20]]
             for key in stat_keys:
                 row.append(self.stat_templates.get(key, '{:.4f}').format(stats.get(key, 0)))
-            row.append(self.create_inline_histogram(stats['column']))
+            row.append(inline_histograms[stats['column']])
             rows.append(row)
-            for i, cell in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
 
-        table_lines = []
-        header_line = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-        separator = "-+-".join("-" * col_widths[i] for i in range(len(headers)))
-        table_lines.append(header_line)
-        table_lines.append(separator)
+        # Measure and pad every cell in C instead of a per-cell
+        # ljust/str/len round-trip through the interpreter.
+        cells = np.array([headers] + rows)
+        col_widths = np.char.str_len(cells).max(axis=0)
+        padded = np.char.ljust(cells, col_widths)
 
-        for row in rows:
-            row_line = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-            table_lines.append(row_line)
+        table_lines = [" | ".join(padded[0])]
+        table_lines.append("-+-".join("-" * w for w in col_widths))
+        table_lines.extend(" | ".join(row) for row in padded[1:])
 
         return "\n".join(table_lines)
 
     def generate_detailed_report(self, all_stats: List[Dict[str, Any]]) -> str:
         """Generate a detailed report with full histograms."""
-        report_lines = []
-        report_lines.append("=" * 80)
-        report_lines.append(f"CSV ANALYSIS REPORT: {os.path.basename(self.csv_path)}")
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append(f"Total Rows: {len(self.data):,}, Numeric Columns: {len(self.numeric_columns)}")
+        # Write into one growable buffer instead of accumulating thousands
+        # of small strings and joining them at the end.
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 80 + "\n")
+        write(f"CSV ANALYSIS REPORT: {os.path.basename(self.csv_path)}\n")
+        write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"Total Rows: {self.row_count:,}, Numeric Columns: {len(self.numeric_columns)}\n")
         if self.sample_size:
-            report_lines.append(f"Sampled: {self.sample_size} rows")
-        report_lines.append(f"Histogram Bins: {self.bins}, Width: {self.histogram_width} chars")
-        report_lines.append("=" * 80)
-        report_lines.append("")
-        report_lines.append("SUMMARY STATISTICS:")
-        report_lines.append(self.format_statistics_table(all_stats))
-        report_lines.append("")
-        report_lines.append("DETAILED HISTOGRAMS:")
-        report_lines.append("")
+            write(f"Sampled: {self.sample_size} rows\n")
+        write(f"Histogram Bins: {self.bins}, Width: {self.histogram_width} chars\n")
+        write("=" * 80 + "\n")
+        write("\nSUMMARY STATISTICS:\n")
+        write(self.format_statistics_table(all_stats))
+        write("\n\nDETAILED HISTOGRAMS:\n\n")
 
         for i, stats in enumerate(all_stats, 1):
-            report_lines.append(f"{i}. {stats['column']}:")
-            report_lines.append(f"   Count: {stats['count']:,}, Missing: {stats['missing']:,}")
-            report_lines.append(f"   Range: [{stats['min']:.4f}, {stats['max']:.4f}], Mean: {stats['mean']:.4f}, Std: {stats['std']:.4f}")
+            if i > 1:
+                write("\n")
+            write(f"{i}. {stats['column']}:\n")
+            write(f"   Count: {stats['count']:,}, Missing: {stats['missing']:,}\n")
+            write(f"   Range: [{stats['min']:.4f}, {stats['max']:.4f}], Mean: {stats['mean']:.4f}, Std: {stats['std']:.4f}\n")
             histogram = self.create_ascii_histogram(stats['column'])
-            report_lines.append("   Distribution:")
-            for line in histogram.split('\n'):
-                report_lines.append(f"   {line}")
-            report_lines.append("")
+            write("   Distribution:\n")
+            # Indent every histogram line in one regex pass.
+            write(re.sub('^', '   ', histogram, flags=re.M))
+            write("\n")
+
+        return buf.getvalue()
+
+    def _run_streaming_analysis(self) -> Optional[List[Dict[str, Any]]]:
+        """Stream the CSV batch-by-batch without materializing a DataFrame.
+
+        Arrow's dataset reader projects only the numeric columns out of each
+        record batch; exact statistics are folded in online and quantiles
+        plus the rendered histograms come from a bounded per-column
+        reservoir, so peak memory is one batch plus the reservoirs and
+        files larger than RAM are fine. Returns None when PyArrow is not
+        installed so the in-memory path can run instead.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.dataset as ds
+        except ImportError:
+            if not self.quiet_mode:
+                print("[WARNING] PyArrow not installed; streaming mode unavailable")
+            return None
 
-        return "\n".join(report_lines)
+        self._clean_cache.clear()
+        self._hist_cache.clear()
+
+        try:
+            dataset = ds.dataset(self.csv_path, format='csv')
+            schema = dataset.schema
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
+        except pa.ArrowInvalid as e:
+            if 'Empty CSV file' in str(e):
+                raise ValueError("CSV file is empty")
+            raise
+
+        numeric_cols = [f.name for f in schema
+                        if pa.types.is_integer(f.type) or pa.types.is_floating(f.type)]
+        if self.columns:
+            if not self.quiet_mode:
+                for c in self.columns:
+                    if c not in schema.names:
+                        print(f"[WARNING] Column '{c}' not found in CSV file")
+            numeric_cols = [c for c in numeric_cols if c in self.columns]
+
+        if not numeric_cols:
+            raise ValueError("No numeric columns found")
+
+        rng = np.random.default_rng(self.random_state)
+        accumulators = {c: _StreamingColumnStats(rng) for c in numeric_cols}
+        row_count = 0
+        for batch in dataset.to_batches(columns=numeric_cols):
+            row_count += batch.num_rows
+            for i, c in enumerate(numeric_cols):
+                # Zero-copy when the chunk has no nulls; nulls force one
+                # copy out of Arrow's validity-masked buffer.
+                accumulators[c].update(
+                    batch.column(i).to_numpy(zero_copy_only=False))
+
+        if row_count == 0:
+            raise ValueError("CSV file contains no data")
+
+        self.row_count = row_count
+        self.numeric_columns = [c for c in numeric_cols
+                                if accumulators[c].count > 0]
+        if not self.numeric_columns:
+            raise ValueError("No numeric columns found")
+
+        all_stats = []
+        for column in self.numeric_columns:
+            acc = accumulators[column]
+            sample = acc.sample()
+            # Histograms and any per-column stats render from the reservoir.
+            self._clean_cache[column] = sample
+            q25, median, q75 = (float(q) for q in
+                                np.quantile(sample, [0.25, 0.5, 0.75]))
+            stats = {
+                'column': column,
+                'count': acc.count,
+                'missing': acc.missing,
+                'min': acc.min,
+                'max': acc.max,
+                'mean': acc.mean,
+                'median': median,
+                'q25': q25,
+                'q75': q75,
+                'std': acc.std,
+                'range': acc.max - acc.min,
+                'iqr': q75 - q25,
+                'cv': acc.std / acc.mean if acc.mean != 0 else 0.0,
+            }
+            if self.show_all_stats:
+                stats['skew'], stats['kurtosis'] = self._skew_kurtosis(sample)
+            all_stats.append(stats)
+
+        return all_stats
 
     def run_analysis(self) -> Tuple[List[Dict[str, Any]], str]:
+        if self.streaming and not self.sample_size:
+            all_stats = self._run_streaming_analysis()
+            if all_stats is not None:
+                return all_stats, self.generate_detailed_report(all_stats)
+
         self.load_and_prepare_data()
-        all_stats = [self.calculate_statistics(c) for c in self.numeric_columns if self.calculate_statistics(c)]
+        all_stats = self._batch_statistics()
+        # Warm the per-column histogram cache in parallel before the report
+        # renders; binning releases the GIL and workers only read self.data.
+        # Warming is best-effort: a column that cannot be binned is left for
+        # the renderers, whose try/except produces its error placeholder.
+        hist_columns = [s['column'] for s in all_stats if s['count'] >= 2]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(self._hist, c) for c in hist_columns]
+            for future in futures:
+                future.exception()
         report = self.generate_detailed_report(all_stats)
         return all_stats, report
 
     def export_results(self, all_stats: List[Dict[str, Any]], format: str = 'txt',
                        output_path: Optional[str] = None) -> None:
         if format == 'csv':
-            df_stats = pd.DataFrame(all_stats)
             if not output_path:
                 base_name = os.path.splitext(os.path.basename(self.csv_path))[0]
                 output_path = f"{base_name}_statistics.csv"
-            df_stats.to_csv(output_path, index=False)
+            # The stats are already a list of dicts; serialize them directly
+            # instead of round-tripping through a DataFrame.
+            fieldnames = list(all_stats[0]) if all_stats else []
+            with open(output_path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames,
+                                        extrasaction='ignore', restval='')
+                writer.writeheader()
+                # Write NaN as an empty cell, as DataFrame.to_csv did.
+                writer.writerows(
+                    {k: '' if isinstance(v, float) and math.isnan(v) else v
+                     for k, v in stats.items()}
+                    for stats in all_stats)
             if not self.quiet_mode:
                 print(f"[INFO] Statistics exported to {output_path}")
         elif format == 'json':
             if not output_path:
                 base_name = os.path.splitext(os.path.basename(self.csv_path))[0]
                 output_path = f"{base_name}_statistics.json"
-            with open(output_path, 'w') as f:
-                json.dump(all_stats, f, indent=2, default=str)
+            try:
+                import orjson
+                # C-level serializer; handles numpy scalars natively and is
+                # several times faster on float-heavy payloads.
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        all_stats,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            except ImportError:
+                with open(output_path, 'w') as f:
+                    json.dump(all_stats, f, indent=2, default=str)
             if not self.quiet_mode:
                 print(f"[INFO] Statistics exported to {output_path}")
         elif format == 'html':
@@ -313,6 +817,8 @@ def main():
     parser.add_argument('--export', '-e', choices=['csv', 'json', 'html', 'txt'], default='txt', help='Export format (default: txt/console output)')
     parser.add_argument('--output', '-o', help='Output file path for exported results')
     parser.add_argument('--all-stats', '-a', action='store_true', help='Show all statistics including skewness and kurtosis')
+    parser.add_argument('--precision', '-p', choices=['f32', 'f64'], default='f32', help='Numeric storage precision; f32 halves memory use (default: f32)')
+    parser.add_argument('--streaming', action='store_true', help='Stream the CSV in batches for files larger than memory (quantiles become reservoir estimates)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output with progress information')
     parser.add_argument('--quiet', '-q', action='store_true', help='Suppress non-essential output')
     parser.add_argument('--version', action='version', version='CSV Visualizer 1.0.0')
@@ -330,7 +836,9 @@ def main():
             bins=args.bins,
             sample_size=args.sample,
             histogram_width=args.histogram_width,
-            show_all_stats=args.all_stats
+            show_all_stats=args.all_stats,
+            precision=args.precision,
+            streaming=args.streaming
         )
         visualizer.quiet_mode = args.quiet
         all_stats, report = visualizer.run_analysis()
@@ -346,7 +854,7 @@ def main():
             print("✅ Analysis complete!")
             print("=" * 60)
             print(f"  📁 File: {args.csv_file}")
-            print(f"  📊 Rows analyzed: {len(visualizer.data):,}")
+            print(f"  📊 Rows analyzed: {visualizer.row_count:,}")
             print(f"  📈 Columns analyzed: {len(visualizer.numeric_columns)}")
             if args.sample:
                 print(f"  🎯 Sample size: {args.sample}")
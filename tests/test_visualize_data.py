@@ -165,6 +165,28 @@ Joshua Rakitch,40,70000,Engineering
         finally:
             os.unlink(csv_path)
     
+    def test_histogram_binned_once_per_column(self):
+        """Detailed and inline renderers must share one binning pass."""
+        csv_path = create_test_csv(self.simple_csv)
+        try:
+            visualizer = CSVVisualizer(csv_path, bins=5)
+            visualizer.load_and_prepare_data()
+
+            calls = []
+            original_bincount = np.bincount
+            np.bincount = lambda *a, **k: calls.append(1) or original_bincount(*a, **k)
+            try:
+                detailed = visualizer.create_ascii_histogram('age')
+                inline = visualizer.create_inline_histogram('age')
+            finally:
+                np.bincount = original_bincount
+
+            assert len(calls) == 1
+            assert '|' in detailed
+            assert len(inline) == 5
+        finally:
+            os.unlink(csv_path)
+
     def test_inline_histogram_insufficient_data(self):
         """Test inline histogram with insufficient data."""
         csv_path = create_test_csv("col\n1")
@@ -177,6 +199,45 @@ Joshua Rakitch,40,70000,Engineering
         finally:
             os.unlink(csv_path)
     
+    def test_batch_statistics_match_per_column(self):
+        """Batched describe() path must agree with calculate_statistics."""
+        csv_path = create_test_csv(self.simple_csv)
+        try:
+            visualizer = CSVVisualizer(csv_path)
+            visualizer.load_and_prepare_data()
+
+            batch = {s['column']: s for s in visualizer._batch_statistics()}
+            for col in visualizer.numeric_columns:
+                single = visualizer.calculate_statistics(col)
+                for key, value in single.items():
+                    if isinstance(value, float):
+                        assert batch[col][key] == pytest.approx(value, rel=1e-12)
+                    else:
+                        assert batch[col][key] == value
+        finally:
+            os.unlink(csv_path)
+
+    def test_streaming_analysis(self):
+        """Test streaming mode against the known column distributions."""
+        pytest.importorskip('pyarrow')
+        csv_path = create_test_csv(self.large_csv)
+        try:
+            visualizer = CSVVisualizer(csv_path, streaming=True)
+            visualizer.quiet_mode = True
+            all_stats, report = visualizer.run_analysis()
+
+            assert visualizer.row_count == 1000
+            by_column = {s['column']: s for s in all_stats}
+            value1 = by_column['value1']
+            assert value1['count'] == 1000
+            assert value1['min'] == 0.0
+            assert value1['max'] == pytest.approx(999 * 1.5)
+            assert value1['mean'] == pytest.approx(999 * 1.5 / 2)
+            assert value1['median'] == pytest.approx(999 * 1.5 / 2, rel=0.01)
+            assert 'CSV ANALYSIS REPORT' in report
+        finally:
+            os.unlink(csv_path)
+
     def test_table_formatting(self):
         """Test statistics table formatting."""
         csv_path = create_test_csv(self.simple_csv)